@@ -57,6 +57,9 @@ class SigintHandler:  # pylint: disable=too-few-public-methods
         sys.exit(2)
 
 
+_TRUE_STRINGS = frozenset({"yes", "true", "t", "1"})
+
+
 def str2bool(string_to_test: str) -> bool:
     """Checks if a given string is a boolean
 
@@ -66,7 +69,19 @@ def str2bool(string_to_test: str) -> bool:
     Returns:
         bool: True when the string is a boolean otherwise False
     """
-    return string_to_test.lower() in ("yes", "true", "True", "t", "1")
+    return string_to_test.lower() in _TRUE_STRINGS
+
+
+def _parse_geometry(geometry: str) -> list[tuple[float, float]]:
+    """Parses the geometry given on the command line.
+
+    Args:
+        geometry (str): list of (lon, lat) points, as a Python literal
+
+    Returns:
+        list[tuple[float, float]]: the points
+    """
+    return ast.literal_eval(geometry)
 
 
 def parse_cli() -> argparse.Namespace:
@@ -175,7 +190,7 @@ def run():
 
         logger.info(f"Running with theses parameters: {arguments}")
 
-        poly = ast.literal_eval(options_cli.geometry)
+        poly = _parse_geometry(options_cli.geometry)
         geometry = Polygon(poly)
 
         footprint = Footprint(geometry)
@@ -14,10 +14,11 @@ Functions included:
 - normalize_lon_to_360: Shift geometry longitudes from [-180, 180] to [0, 360].
 - normalize_lon_to_180: Convert geometry longitudes from [0, 360] back to [-180, 180].
 """
+import numpy as np
+import shapely
 from shapely.geometry import LineString
 from shapely.geometry import MultiPolygon
 from shapely.geometry import Polygon
-from shapely.ops import transform
 
 
 def reorganize_longitudes(line: LineString) -> list[tuple[float, float]]:
@@ -67,11 +68,13 @@ def normalize_lon_to_360(
         Geometry with longitudes shifted to [0, 360].
     """
 
-    def _shift(x: float, y: float) -> tuple[float, float]:
-        x_new = x + 360 if x < 0 else x
-        return x_new, y
+    def _shift(coords: np.ndarray) -> np.ndarray:
+        shifted = coords.copy()
+        lon = coords[:, 0]
+        shifted[:, 0] = np.where(lon < 0, lon + 360, lon)
+        return shifted
 
-    return transform(_shift, geom)
+    return shapely.transform(geom, _shift, include_z=True)
 
 
 def normalize_lon_to_180(
@@ -94,11 +97,11 @@ def normalize_lon_to_180(
         Geometry with longitudes shifted to [-180, 180].
     """
 
-    def _unshift(x: float, y: float) -> tuple[float, float]:
-        if not is_360_space:
-            x_new = x - 360 if x > 180 else x
-        else:
-            x_new = x - 360 if x >= 180 else x
-        return x_new, y
+    def _unshift(coords: np.ndarray) -> np.ndarray:
+        unshifted = coords.copy()
+        lon = coords[:, 0]
+        to_shift = lon >= 180 if is_360_space else lon > 180
+        unshifted[:, 0] = np.where(to_shift, lon - 360, lon)
+        return unshifted
 
-    return transform(_unshift, geom)
+    return shapely.transform(geom, _unshift, include_z=True)
@@ -32,6 +32,7 @@ DensifyGeometryGeodesic
 """
 import numba
 import numpy as np
+import shapely
 from shapely.geometry import Polygon
 
 from .exception import InvalidGeometryError
@@ -41,142 +42,117 @@ from .monitoring import UtilsMonitoring
 logger = get_logger(__name__)
 
 
-@numba.jit(cache=True)
-def _lonlat_to_unit(lon: float, lat: float) -> np.ndarray:
+def _lonlat_to_unit(lon: float | np.ndarray, lat: float | np.ndarray) -> np.ndarray:
     """
-    Convert longitude and latitude to a 3D unit vector.
+    Convert longitude and latitude to 3D unit vectors.
+
+    Inputs broadcast against each other, so a whole ring is converted in
+    a few vectorized operations.
 
     Parameters
     ----------
-    lon : float
-        Longitude in degrees.
-    lat : float
-        Latitude in degrees.
+    lon : float or numpy.ndarray
+        Longitude(s) in degrees.
+    lat : float or numpy.ndarray
+        Latitude(s) in degrees.
 
     Returns
     -------
     numpy.ndarray
-        3D unit vector corresponding to the point on the sphere.
+        Array of shape (..., 3) containing the unit vectors of the points
+        on the sphere.
     """
     lon_rad = np.deg2rad(lon)
     lat_rad = np.deg2rad(lat)
-    return np.array(
-        [
-            np.cos(lat_rad) * np.cos(lon_rad),
-            np.cos(lat_rad) * np.sin(lon_rad),
-            np.sin(lat_rad),
-        ]
+    cos_lat = np.cos(lat_rad)
+    return np.stack(
+        np.broadcast_arrays(
+            cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad)
+        ),
+        axis=-1,
     )
 
 
-@numba.jit(cache=True)
-def _unit_to_lonlat(u: np.ndarray):
+def _unit_to_lonlat(u: np.ndarray) -> np.ndarray:
     """
-    Convert a 3D unit vector back to geographic coordinates.
+    Convert 3D unit vectors back to geographic coordinates.
     This is the inverse operation of ``_lonlat_to_unit``.
 
     Parameters
     ----------
     u : numpy.ndarray
-    3D unit vector [x, y, z].
+        Array of shape (..., 3) containing unit vectors [x, y, z].
 
     Returns
     -------
     numpy.ndarray
-    Array ``[lon, lat]`` in degrees.
+        Array of shape (..., 2) containing ``[lon, lat]`` in degrees.
     """
-    out = np.empty(2, dtype=np.float64)
-
-    lon = np.arctan2(u[1], u[0])
-    lat = np.arcsin(u[2])
-
-    out[0] = np.rad2deg(lon)
-    out[1] = np.rad2deg(lat)
-
-    return out
+    u = np.asarray(u, dtype=np.float64)
+    lon = np.arctan2(u[..., 1], u[..., 0])
+    lat = np.arcsin(np.clip(u[..., 2], -1.0, 1.0))
+    return np.stack((np.rad2deg(lon), np.rad2deg(lat)), axis=-1)
 
 
 @numba.jit(cache=True)
-def _densify_segment_km(
-    lon0,
-    lat0,
-    lon1,
-    lat1,
-    max_step_km,
-    radius_planet,
-):
+def _slerp_fill(coords, units, thetas, counts, offsets, out):
     """
-    Densify a geodesic segment between two geographic points.
+    Fill a preallocated buffer with the points of every densified segment.
 
-    Intermediate points are inserted along the great-circle arc so that
-    the distance between consecutive points does not exceed ``max_step_km``.
+    Segment ``k`` writes ``counts[k]`` points starting at ``out[offsets[k]]``:
+    its start point when ``thetas[k]`` is 0, otherwise the SLERP points of
+    its great-circle arc sampled at ``t = i / counts[k]``. The arithmetic is
+    done on scalars, so no temporary array is allocated per point.
 
     Parameters
     ----------
-    lon0, lat0 : float
-    Longitude and latitude of the segment start point (degrees).
-    lon1, lat1 : float
-    Longitude and latitude of the segment end point (degrees).
-    max_step_km : float
-    Maximum allowed distance between two consecutive points (km).
-    radius_planet : float
-    Radius of the planet (km).
-
-    Returns
-    -------
-    numpy.ndarray
-    Array of shape (N, 2) containing interpolated (lon, lat) points.
-    The first point corresponds to the start of the segment.
-
+    coords : numpy.ndarray
+    Array of shape (N, 2) containing the closed ring (lon, lat) in degrees.
+    units : numpy.ndarray
+    Array of shape (N, 3) containing the unit vectors of ``coords``.
+    thetas : numpy.ndarray
+    Central angle of each segment to interpolate, 0 for segments that only
+    contribute their start point.
+    counts : numpy.ndarray
+    Number of points contributed by each segment.
+    offsets : numpy.ndarray
+    Index in ``out`` of the first point of each segment.
+    out : numpy.ndarray
+    Output buffer of shape (M, 2) receiving (lon, lat) in degrees.
     """
-    # Convert endpoints to unit vectors
-    u0 = _lonlat_to_unit(lon0, lat0)
-    u1 = _lonlat_to_unit(lon1, lat1)
-
-    # Dot product gives cos(theta) where theta is the central angle
-    dot = u0[0] * u1[0] + u0[1] * u1[1] + u0[2] * u1[2]
-
-    # Numerical safety: clamp to valid acos range
-    if dot > 1.0:
-        dot = 1.0
-    elif dot < -1.0:
-        dot = -1.0
-
-    theta = np.arccos(dot)
-
-    # Degenerate case: points are almost identical
-    if theta < 1e-12:
-        out = np.empty((1, 2), dtype=np.float64)
-        out[0, 0] = lon0
-        out[0, 1] = lat0
-        return out
-
-    # Convert maximum linear step to angular step
-    step_angle = max_step_km / radius_planet
-    n = int(np.ceil(theta / step_angle))
-    if n < 1:
-        n = 1
-
-    out = np.empty((n + 1, 2), dtype=np.float64)
-    sin_theta = np.sin(theta)
-
-    # Spherical linear interpolation (SLERP)
-    for i in range(n + 1):
-        t = i / n
-
-        s0 = np.sin((1.0 - t) * theta)
-        s1 = np.sin(t * theta)
-
-        u = (s0 * u0 + s1 * u1) / sin_theta
-
-        # Explicit renormalization for numerical stability
-        norm = np.sqrt(u[0] * u[0] + u[1] * u[1] + u[2] * u[2])
-        u /= norm
-
-        out[i, 0] = np.rad2deg(np.arctan2(u[1], u[0]))
-        out[i, 1] = np.rad2deg(np.arcsin(u[2]))
-
-    return out
+    for k in range(counts.shape[0]):
+        n = counts[k]
+        theta = thetas[k]
+        start = offsets[k]
+        if n == 0:
+            continue
+        if theta == 0.0:
+            out[start, 0] = coords[k, 0]
+            out[start, 1] = coords[k, 1]
+            continue
+
+        x0, y0, z0 = units[k, 0], units[k, 1], units[k, 2]
+        x1, y1, z1 = units[k + 1, 0], units[k + 1, 1], units[k + 1, 2]
+        sin_theta = np.sin(theta)
+
+        # Spherical linear interpolation (SLERP)
+        for i in range(n):
+            t = i / n
+            s0 = np.sin((1.0 - t) * theta)
+            s1 = np.sin(t * theta)
+
+            x = (s0 * x0 + s1 * x1) / sin_theta
+            y = (s0 * y0 + s1 * y1) / sin_theta
+            z = (s0 * z0 + s1 * z1) / sin_theta
+
+            # Explicit renormalization for numerical stability
+            norm = np.sqrt(x * x + y * y + z * z)
+            x /= norm
+            y /= norm
+            z /= norm
+
+            out[start + i, 0] = np.rad2deg(np.arctan2(y, x))
+            out[start + i, 1] = np.rad2deg(np.arcsin(z))
 
 
 class DensifyGeometryGeodesic:
@@ -227,19 +203,24 @@ class DensifyGeometryGeodesic:
 
     def _densify_ring_km(
         self,
-        coords: list[tuple[float, float]],
+        coords: list[tuple[float, float]] | np.ndarray,
         max_step_km: float,
         radius_planet: float,
-    ) -> list[tuple[float, float]]:
+    ) -> np.ndarray:
         """
         Densify a closed linear ring (exterior or interior of a polygon).
 
-        Each consecutive coordinate pair is densified independently and
-        concatenated to form a new closed ring.
+        Each consecutive coordinate pair is densified along its great-circle
+        arc and concatenated to form a new closed ring. A segment longer than
+        ``max_step_km`` is subdivided so that every sub-arc is strictly shorter
+        than the step; shorter segments are kept as is and repeated points are
+        dropped. Segments joining two points at a pole are degenerate (SLERP
+        would collapse them to a single point), so only their endpoints are
+        kept.
 
         Parameters
         ----------
-        coords : list of (lon, lat)
+        coords : list of (lon, lat) or numpy.ndarray
             Ring coordinates.
         max_step_km : float
             Maximum distance between interpolated points.
@@ -248,51 +229,111 @@ class DensifyGeometryGeodesic:
 
         Returns
         -------
-        list of (lon, lat)
-            Densified ring coordinates.
+        numpy.ndarray
+            Array of shape (N, 2) containing the densified ring coordinates.
         """
-        coords = list(coords)
+        coords = np.asarray(coords, dtype=np.float64)
 
-        if coords[0] != coords[-1]:
+        if not np.array_equal(coords[0], coords[-1]):
             logger.debug("Closing ring by duplicating first coordinate.")
-            coords.append(coords[0])
-
-        new_coords = []
-        for (lon0, lat0), (lon1, lat1) in zip(coords[:-1], coords[1:]):
-            # Cas dégénéré : segment le long d'un pôle (lat = ±90)
-            # Les deux points sont au même point géographique (pôle),
-            # SLERP retourne un seul point et le bord disparaît.
-            # On garde juste les deux extrémités — Douglas-Peucker
-            # supprimera les points colinéaires de toute façon.
-            if abs(lat0) >= 90 - 1e-10 and abs(lat1) >= 90 - 1e-10:
-                logger.debug(
-                    "Degenerate polar segment ({}, {}) -> ({}, {}): using endpoints only.",
-                    lon0,
-                    lat0,
-                    lon1,
-                    lat1,
-                )
-                segment = [(lon0, lat0), (lon1, lat1)]
-            else:
-                segment = list(
-                    _densify_segment_km(
-                        lon0, lat0, lon1, lat1, max_step_km, radius_planet
-                    )
-                )
-
-            # Drop last point to avoid duplicates between segments
-            new_coords.extend(segment[:-1])
+            coords = np.vstack((coords, coords[:1]))
+
+        # Central angle of every segment, from one batched dot product
+        units = _lonlat_to_unit(coords[:, 0], coords[:, 1])
+        dots = np.clip(np.einsum("ij,ij->i", units[:-1], units[1:]), -1.0, 1.0)
+        thetas = np.arccos(dots)
+        # Identical consecutive points are compared exactly, as their dot
+        # product can round to just below 1
+        moves = np.any(coords[:-1] != coords[1:], axis=1)
+
+        # Nothing to insert when every edge is already shorter than the step
+        step_angle = max_step_km / radius_planet
+        if len(thetas) and thetas.max() <= step_angle:
+            # Repeated points are dropped as on the general path: a vertex is
+            # kept when the edge it starts is not zero-length, plus the
+            # closing vertex. A fully degenerate ring goes on to the general
+            # path, which reports it as empty.
+            if moves.any():
+                logger.debug("Ring is already dense enough. No densification needed.")
+                return coords[np.append(moves, True)]
+
+        # Number of points contributed by each segment (its last point is
+        # dropped, being the first point of the next segment):
+        # - identical points contribute nothing, short segments their start;
+        # - long segments their n subdivisions along the great circle;
+        # - segments joining two points at a pole are degenerate (SLERP
+        #   would collapse them to a single point), so only their start.
+        # Long segments get n = floor(theta / step_angle) + 1 subdivisions,
+        # computed by integer truncation (no ceil), so that every sub-arc is
+        # strictly shorter than the step
+        short = (step_angle >= np.pi) | (dots >= np.cos(step_angle))
+        subdivisions = (thetas * (radius_planet / max_step_km)).astype(np.int64) + 1
+        counts = np.where(short, moves.astype(np.int64), subdivisions)
+        lats = np.abs(coords[:, 1])
+        polar = (lats[:-1] >= 90 - 1e-10) & (lats[1:] >= 90 - 1e-10)
+        for index in np.flatnonzero(polar):
+            logger.debug(
+                "Degenerate polar segment ({}, {}) -> ({}, {}): using endpoints only.",
+                coords[index, 0],
+                coords[index, 1],
+                coords[index + 1, 0],
+                coords[index + 1, 1],
+            )
+        counts[polar] = 1
+        thetas = np.where(short | polar, 0.0, thetas)
 
-        if new_coords:
-            new_coords.append(new_coords[0])
-            logger.debug(f"Closed densified ring with {len(new_coords)} coordinates.")
-        else:
+        total = int(counts.sum())
+        if total == 0:
             logger.warning(
                 "Densified ring is empty. Check input coordinates and parameters."
             )
+            return np.empty((0, 2), dtype=np.float64)
+
+        # Single output buffer, sized exactly from the counts (no growth or
+        # list appends needed) and closed by repeating its first point.
+        # Each segment writes its slice starting at its offset.
+        offsets = np.cumsum(counts) - counts
+        new_coords = np.empty((total + 1, 2), dtype=np.float64)
+        _slerp_fill(coords, units, thetas, counts, offsets, new_coords)
+        new_coords[total] = new_coords[0]
+        logger.debug(f"Closed densified ring with {len(new_coords)} coordinates.")
 
         return new_coords
 
+    @staticmethod
+    def _build_polygon(
+        exterior_coords: np.ndarray, interiors: list[np.ndarray]
+    ) -> Polygon:
+        """
+        Build a polygon from densified ring arrays with Shapely's vectorized
+        constructors: all the holes are created in a single GEOS call.
+
+        Parameters
+        ----------
+        exterior_coords : numpy.ndarray
+            Closed exterior ring, of shape (N, 2).
+        interiors : list of numpy.ndarray
+            Closed interior rings. Empty rings are ignored.
+
+        Returns
+        -------
+        shapely.geometry.Polygon
+            Polygon, empty if the exterior ring is empty.
+        """
+        if not len(exterior_coords):
+            return Polygon()
+
+        interiors = [ring for ring in interiors if len(ring)]
+        holes = None
+        if interiors:
+            holes = shapely.linearrings(
+                np.concatenate(interiors),
+                indices=np.repeat(
+                    np.arange(len(interiors)), [len(ring) for ring in interiors]
+                ),
+            )
+        return shapely.polygons(shapely.linearrings(exterior_coords), holes=holes)
+
     @UtilsMonitoring.time_spend(level="DEBUG")
     def densify_polygon_km(
         self, max_step_km: float = 5.0, radius_planet: float = R_EARTH_KM
@@ -316,25 +357,25 @@ class DensifyGeometryGeodesic:
         """
         logger.debug(
             f"""
-                Running _densify_segment_km with the following parameter:
+                Running _densify_ring_km with the following parameter:
                     - max_step_km = {max_step_km}
                     - radius_planet = {radius_planet}"""
         )
         polygon = self.geometry
 
-        # Densify exterior ring
+        # Densify exterior ring (rings are handed to Shapely as ndarrays, which
+        # avoids materializing intermediate lists of tuples)
         exterior_coords = self._densify_ring_km(
-            polygon.exterior.coords, max_step_km, radius_planet
+            np.asarray(polygon.exterior.coords), max_step_km, radius_planet
         )
 
         # Densify interior rings (holes)
-        interiors = []
-        for ring in polygon.interiors:
-            interiors.append(
-                self._densify_ring_km(ring.coords, max_step_km, radius_planet)
-            )
+        interiors = [
+            self._densify_ring_km(np.asarray(ring.coords), max_step_km, radius_planet)
+            for ring in polygon.interiors
+        ]
 
-        densified_poly = Polygon(exterior_coords, interiors)
+        densified_poly = self._build_polygon(exterior_coords, interiors)
         logger.debug(
             "Densified polygon: {} points exterior, {} holes",
             len(exterior_coords),
@@ -7,6 +7,8 @@ Module to handle polygons representing satellite footprints or geographic region
 Provides utilities to ensure valid GeoJSON polygons, densify geometries along geodesic paths,
 handle polar regions, equator and antimeridian crossings, and project polygons to Plate Carrée.
 """
+import numpy as np
+import shapely
 from shapely.geometry import MultiPolygon
 from shapely.geometry import Polygon
 from shapely.ops import orient
@@ -70,16 +72,14 @@ class Footprint:
         Stats
             Statistics object summarizing polygon latitude distribution.
         """
-        coords = list(self.geometry.exterior.coords)
-        latitudes = [y for _, y in coords]
+        # Vectorized reductions over the exterior latitudes
+        latitudes = shapely.get_coordinates(self.geometry.exterior)[:, 1]
 
-        positive_lat = sum(1 for lat in latitudes if lat >= 0)
-        negative_lat = sum(1 for lat in latitudes if lat < 0)
-        only_positive_lat = positive_lat == len(latitudes)
-        only_negative_lat = negative_lat == len(latitudes)
+        only_positive_lat = bool((latitudes >= 0).all())
+        only_negative_lat = bool((latitudes < 0).all())
 
-        high_latitude_pos = sum(1 for lat in latitudes if lat > 60)
-        high_latitude_neg = sum(1 for lat in latitudes if lat < -60)
+        high_latitude_pos = int(np.count_nonzero(latitudes > 60))
+        high_latitude_neg = int(np.count_nonzero(latitudes < -60))
 
         return Stats(
             only_positive_lat=only_positive_lat,
@@ -234,21 +234,28 @@ class Footprint:
                 poly_car_simplified, reverse=True
             )
         else:
-            geoms = []
+            # Densification and simplification work part by part, but each
+            # projection is applied to all the parts at once (one pyproj call)
+            geoms_density = []
             for geom in geometry.geoms:
                 self.densify_geometry.geometry = geom
-                geometry_density = self.densify_geometry.densify_polygon_km(
-                    **filtered_kwargs_densify
+                geoms_density.append(
+                    self.densify_geometry.densify_polygon_km(**filtered_kwargs_densify)
                 )
-                poly_car = self.projection.project_to_plate_carree(geometry_density)
-                poly_car_simplified = DensifyGeometryGeodesic.limit_polygon_vertices(
-                    poly_car, **filtered_kwargs_limit_poly
-                )
-                geom_simplified = self.projection.project_to_plate_carree(
-                    poly_car_simplified, reverse=True
-                )
-                geoms.append(geom_simplified)
-            wgs84_simplified = MultiPolygon(geoms)
+            multi_car = self.projection.project_to_plate_carree(
+                MultiPolygon(geoms_density)
+            )
+            multi_car_simplified = MultiPolygon(
+                [
+                    DensifyGeometryGeodesic.limit_polygon_vertices(
+                        poly_car, **filtered_kwargs_limit_poly
+                    )
+                    for poly_car in multi_car.geoms
+                ]
+            )
+            wgs84_simplified = self.projection.project_to_plate_carree(
+                multi_car_simplified, reverse=True
+            )
         final_geom_nb_points = self._compute_nb_points(wgs84_simplified)
         logger.info(
             f"Generate a footprint with {final_geom_nb_points} (compatible with GeoJSON format and CAR projection)"
@@ -279,11 +286,14 @@ def check_polygon(poly: Polygon | MultiPolygon, verbose: bool = True) -> dict:
         - exterior_ccw: whether exterior ring is counter-clockwise
         - nb_points: number of points in exterior (or list per polygon)
     """
+    # Validity (a full GEOS topology check) and area are computed only once
+    is_valid = poly.is_valid
+    area = poly.area
     results = {}
-    results["is_valid"] = poly.is_valid
-    results["validity_reason"] = None if poly.is_valid else explain_validity(poly)
-    results["area"] = poly.area
-    results["has_area"] = poly.area > 0
+    results["is_valid"] = is_valid
+    results["validity_reason"] = None if is_valid else explain_validity(poly)
+    results["area"] = area
+    results["has_area"] = area > 0
     results["exterior_ccw"] = (
         poly.exterior.is_ccw
         if isinstance(poly, Polygon)
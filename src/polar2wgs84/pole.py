@@ -19,6 +19,7 @@ PoleFactory
     Factory class to instantiate the correct pole class based on polygon location.
 """
 import numpy as np
+import shapely
 from shapely.geometry import LineString
 from shapely.geometry import Point
 from shapely.geometry import Polygon
@@ -52,6 +53,9 @@ class Pole:
     POLE_NORTH_LATITUDE = 90
     POLE_SOUTH_LATITUDE = -90
 
+    # Position of the pole in polar stereographic coordinates
+    POLAR_ORIGIN = Point(0, 0)
+
     def __init__(self, geometry: Polygon, pole_latitude: float):
         """
         Initialize a Pole object with its polygon and pole latitude.
@@ -75,7 +79,8 @@ class Pole:
         self.is_pole_included = self._is_pole_included(geometry_polar)
         logger.debug("Pole is contained in the geometry: {}", self.is_pole_included)
 
-    def _is_pole_included(self, geom: Polygon, tol: float = 1e-6) -> bool:
+    @staticmethod
+    def _is_pole_included(geom: Polygon, tol: float = 1e-6) -> bool:
         """
         Determine if the pole is included in a polar-projected polygon.
 
@@ -91,7 +96,30 @@ class Pole:
         bool
             True if the pole is contained in the polygon.
         """
-        return geom.buffer(-tol).contains(Point(0, 0))
+        # The pole can only be inside the polygon if it is strictly inside its
+        # bounding box: this cheap test avoids the buffer for most polygons
+        minx, miny, maxx, maxy = geom.bounds
+        if not (minx < 0 < maxx and miny < 0 < maxy):
+            return False
+        return geom.buffer(-tol).contains(Pole.POLAR_ORIGIN)
+
+    @staticmethod
+    def _as_soa(coords: list[tuple[float, float]]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Split a sequence of (lon, lat) vertices into two parallel arrays.
+
+        Parameters
+        ----------
+        coords : list of tuple of float
+            Vertices as (lon, lat) pairs.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            Contiguous float64 arrays of longitudes and latitudes.
+        """
+        lon, lat = np.asarray(coords, dtype=np.float64).T
+        return np.ascontiguousarray(lon), np.ascontiguousarray(lat)
 
     def _insert_all_sign_changes(self, line: LineString, point: Point) -> LineString:
         """
@@ -111,16 +139,17 @@ class Pole:
         LineString
             Updated LineString with points inserted at all sign changes.
         """
-        coords = list(line.coords)
-        i = 0
-        while i < len(coords) - 1:
-            x1, _ = coords[i]
-            x2, _ = coords[i + 1]
-            if x1 * x2 < 0:
-                coords.insert(i + 1, (point.x, point.y))
-                i += 1
-            i += 1
-        return LineString(coords)
+        coords = shapely.get_coordinates(line)
+        lon = coords[:, 0]
+
+        # Segments whose end longitudes have strictly opposite signs
+        is_sign_change = lon[:-1] * lon[1:] < 0
+        if not is_sign_change.any():
+            return line
+
+        # Insert the point after the first vertex of each of these segments
+        indices = np.flatnonzero(is_sign_change) + 1
+        return LineString(np.insert(coords, indices, (point.x, point.y), axis=0))
 
     @UtilsMonitoring.time_spend(level="DEBUG")
     def make_valid_geojson_geometry(self) -> Polygon:
@@ -157,23 +186,29 @@ class Pole:
                 line_180, Point(-180, point.y)
             )
 
-            # Create a polar cap along the pole
-            cap_ring = [
-                (lon, self.pole_latitude)
-                for lon in np.linspace(
-                    PoleFactory.LONGITUDE_EST, PoleFactory.LONGITUDE_WEST, 2
-                )
-            ]
+            # Reorganize coordinates, kept as parallel lon/lat arrays
+            lon, lat = self._as_soa(reorganize_longitudes(line))
 
-            # Reorganize coordinates and append polar cap
-            coords_reorder = reorganize_longitudes(line)
-            coords_reorder.extend(cap_ring)
+            # Append a polar cap along the pole
+            cap_lon = np.linspace(
+                PoleFactory.LONGITUDE_EST, PoleFactory.LONGITUDE_WEST, 2
+            )
+            lon = np.concatenate((lon, cap_lon))
+            lat = np.concatenate((lat, np.full(cap_lon.shape, self.pole_latitude)))
 
             # Ensure polygon closure
-            if coords_reorder[0] != coords_reorder[-1]:
-                coords_reorder.append(coords_reorder[0])
-
-            polygon_wgs84 = orient(Polygon(coords_reorder))
+            if lon[0] != lon[-1] or lat[0] != lat[-1]:
+                lon = np.append(lon, lon[0])
+                lat = np.append(lat, lat[0])
+
+            # The ring is monotonic in longitude and closed by the cap, so the
+            # sign of its shoelace area gives its orientation: make it CCW
+            signed_area = 0.5 * np.sum(lon[:-1] * lat[1:] - lon[1:] * lat[:-1])
+            if signed_area < 0:
+                lon = lon[::-1]
+                lat = lat[::-1]
+
+            polygon_wgs84 = Polygon(np.column_stack((lon, lat)))
         else:
             polygon_wgs84 = self.geometry
 
@@ -243,3 +278,28 @@ class PoleFactory:
         """
         latitude = geometry.exterior.coords[0][1]
         return NorthPole(geometry) if latitude >= 0 else SouthPole(geometry)
+
+    @staticmethod
+    def create_many(geometries: list[Polygon]) -> list[Pole]:
+        """
+        Create the appropriate Pole instance for each polygon.
+
+        The latitude of the first vertex of every polygon is read with a
+        single vectorized call instead of one coordinate access per polygon.
+
+        Parameters
+        ----------
+        geometries : list of Polygon
+            Input polygons.
+
+        Returns
+        -------
+        list of Pole
+            NorthPole or SouthPole instance for each polygon, in input order.
+        """
+        first_points = shapely.get_point(shapely.get_exterior_ring(geometries), 0)
+        latitudes = shapely.get_y(first_points)
+        return [
+            NorthPole(geometry) if latitude >= 0 else SouthPole(geometry)
+            for geometry, latitude in zip(geometries, latitudes)
+        ]
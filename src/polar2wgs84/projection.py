@@ -15,15 +15,15 @@ Stats
     Data class summarizing polygon latitude statistics.
 """
 from dataclasses import dataclass
+from functools import lru_cache
 
 import numpy as np
+import shapely
 from pyproj import CRS
 from pyproj import Transformer
 from shapely.geometry import MultiPolygon
 from shapely.geometry import Polygon
-from shapely.ops import transform
 
-from .angle_operation import normalize_lon_to_360
 from .exception import UnsupportedGeometryTypeError
 from .logging_config import get_logger
 from .monitoring import UtilsMonitoring
@@ -31,6 +31,60 @@ from .monitoring import UtilsMonitoring
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_transformers(crs_name: str) -> tuple[Transformer, Transformer]:
+    """
+    Return the transformers between WGS84 and a CRS of ``Projection``,
+    building them on first use only.
+
+    Creating a pyproj Transformer initializes a PROJ pipeline, which costs
+    far more than transforming the points themselves, so each CRS is
+    resolved once per process. The cache is keyed by the attribute name of
+    the CRS, which is much cheaper to hash than a pyproj CRS.
+
+    Parameters
+    ----------
+    crs_name : str
+        Name of the CRS attribute of ``Projection`` (e.g. "POLAR_NORTH").
+
+    Returns
+    -------
+    tuple[Transformer, Transformer]
+        Transformers from WGS84 to the CRS and from the CRS to WGS84, using
+        the (x=lon, y=lat) axis order.
+    """
+    crs = getattr(Projection, crs_name)
+    return (
+        Transformer.from_crs(Projection.WGS_84, crs, always_xy=True),
+        Transformer.from_crs(crs, Projection.WGS_84, always_xy=True),
+    )
+
+
+class _TransformAlias:
+    """
+    Class attribute exposing the ``transform`` method of a cached transformer.
+
+    The transformer is resolved on first access through ``_get_transformers``,
+    so defining the attribute does not build any PROJ pipeline at import.
+    """
+
+    def __init__(self, crs_name: str, from_wgs84: bool):
+        """
+        Parameters
+        ----------
+        crs_name : str
+            Name of the CRS attribute of ``Projection`` (e.g. "POLAR_NORTH").
+        from_wgs84 : bool
+            True for the WGS84 to CRS direction, False for the inverse one.
+        """
+        self.crs_name = crs_name
+        self.from_wgs84 = from_wgs84
+
+    def __get__(self, instance, owner):
+        to_crs, from_crs = _get_transformers(self.crs_name)
+        return (to_crs if self.from_wgs84 else from_crs).transform
+
+
 class Projection:
     """
     Handles projections of geometries between WGS84, Plate Carrée,
@@ -63,31 +117,56 @@ class Projection:
         """
     )
 
-    # Predefined Transformers
-    WGS84_TO_PLATE_CARREE = Transformer.from_crs(
-        WGS_84, PLATE_CARREE, always_xy=True
-    ).transform
-    PLATE_CARREE_TO_WGS84 = Transformer.from_crs(
-        PLATE_CARREE, WGS_84, always_xy=True
-    ).transform
-
-    WGS84_TO_POLAR_NORTH = Transformer.from_crs(
-        WGS_84, POLAR_NORTH, always_xy=True
-    ).transform
-    POLAR_NORTH_TO_WGS84 = Transformer.from_crs(
-        POLAR_NORTH, WGS_84, always_xy=True
-    ).transform
-
-    WGS84_TO_POLAR_SOUTH = Transformer.from_crs(
-        WGS_84, POLAR_SOUTH, always_xy=True
-    ).transform
-    POLAR_SOUTH_TO_WGS84 = Transformer.from_crs(
-        POLAR_SOUTH, WGS_84, always_xy=True
-    ).transform
+    # Transform functions, kept for backward compatibility: they are the
+    # ``transform`` methods of the transformers shared by all the instances
+    WGS84_TO_PLATE_CARREE = _TransformAlias("PLATE_CARREE", from_wgs84=True)
+    PLATE_CARREE_TO_WGS84 = _TransformAlias("PLATE_CARREE", from_wgs84=False)
+
+    WGS84_TO_POLAR_NORTH = _TransformAlias("POLAR_NORTH", from_wgs84=True)
+    POLAR_NORTH_TO_WGS84 = _TransformAlias("POLAR_NORTH", from_wgs84=False)
+
+    WGS84_TO_POLAR_SOUTH = _TransformAlias("POLAR_SOUTH", from_wgs84=True)
+    POLAR_SOUTH_TO_WGS84 = _TransformAlias("POLAR_SOUTH", from_wgs84=False)
 
     def __init__(self):
-        """Empty constructor; all transformations are class-level."""
-        pass
+        """
+        Resolve the transformers once, so that projecting a geometry does not
+        need any cache lookup. Transformers are shared between instances.
+        """
+        self._to_north, self._from_north = _get_transformers("POLAR_NORTH")
+        self._to_south, self._from_south = _get_transformers("POLAR_SOUTH")
+        self._to_plate_carree, self._from_plate_carree = _get_transformers(
+            "PLATE_CARREE"
+        )
+
+    @staticmethod
+    def _transform(
+        geom: Polygon | MultiPolygon, transformer: Transformer
+    ) -> Polygon | MultiPolygon:
+        """
+        Project all the coordinates of a geometry with a single batched call.
+
+        The coordinates of every part and ring are flattened into one (N, 2)
+        array, projected by a single pyproj call, then scattered back onto a
+        new geometry with the same structure. The Z coordinates of a 3D
+        geometry are transformed along. The input geometry is left unchanged.
+
+        Parameters
+        ----------
+        geom : Polygon or MultiPolygon
+            Geometry to project.
+        transformer : Transformer
+            Transformer to apply.
+
+        Returns
+        -------
+        Polygon or MultiPolygon
+            Projected geometry.
+        """
+        has_z = bool(shapely.has_z(geom))
+        coords = shapely.get_coordinates(geom, include_z=has_z)
+        projected = transformer.transform(*coords.T)
+        return shapely.set_coordinates(geom, np.column_stack(projected))
 
     def project_to_polar(
         self,
@@ -112,25 +191,12 @@ class Projection:
         Polygon or MultiPolygon
             Projected geometry.
         """
-        if reverse:
-            transformer = (
-                Projection.POLAR_NORTH_TO_WGS84
-                if is_north
-                else Projection.POLAR_SOUTH_TO_WGS84
-            )
-        else:
-            transformer = (
-                Projection.WGS84_TO_POLAR_NORTH
-                if is_north
-                else Projection.WGS84_TO_POLAR_SOUTH
-            )
-
-        if isinstance(geom, Polygon):
-            projected_geom = transform(transformer, geom)
+        if is_north:
+            transformer = self._from_north if reverse else self._to_north
         else:
-            projected_geom = MultiPolygon(
-                transform(transformer, poly) for poly in geom.geoms
-            )
+            transformer = self._from_south if reverse else self._to_south
+
+        projected_geom = self._transform(geom, transformer)
 
         logger.debug(
             "Projected geometry using {} polar projection (reverse={})",
@@ -158,18 +224,9 @@ class Projection:
         Polygon or MultiPolygon
             Projected geometry.
         """
-        transformer = (
-            Projection.PLATE_CARREE_TO_WGS84
-            if reverse
-            else Projection.WGS84_TO_PLATE_CARREE
-        )
+        transformer = self._from_plate_carree if reverse else self._to_plate_carree
 
-        if isinstance(geom, Polygon):
-            projected_geom = transform(transformer, geom)
-        else:
-            projected_geom = MultiPolygon(
-                transform(transformer, poly) for poly in geom.geoms
-            )
+        projected_geom = self._transform(geom, transformer)
 
         logger.debug("Projected geometry to Plate Carrée (reverse={})", reverse)
         return projected_geom
@@ -198,21 +255,116 @@ class Stats:
     high_latitude_neg: int
 
 
-def compute_nbpoints(geometry: Polygon | MultiPolygon):
-    if isinstance(geometry, MultiPolygon):
-        nb_points = 0
-        for poly in geometry.geoms:
-            nb_points += len(poly.exterior.coords)
+def compute_nbpoints(geometry: Polygon | MultiPolygon) -> int:
+    """
+    Count the vertices of the exterior rings of a Polygon or MultiPolygon.
+
+    Parameters
+    ----------
+    geometry : Polygon or MultiPolygon
+        The input geometry.
+
+    Returns
+    -------
+    int
+        Number of exterior vertices, closing vertices included.
+    """
+    if not isinstance(geometry, (Polygon, MultiPolygon)):
+        raise UnsupportedGeometryTypeError(type(geometry))
+
+    exteriors = shapely.get_exterior_ring(shapely.get_parts(geometry))
+    return int(shapely.get_num_coordinates(exteriors).sum())
+
+
+def _ring_centroids(rings: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the centroid and the weight of each ring with the shoelace formula.
+
+    A ring with an edge crossing the antimeridian (a longitude jump of more
+    than 180° but less than 360°) is unwrapped to [0, 360] before its
+    centroid is computed; a jump of exactly 360° is an edge lying along the
+    antimeridian, such as the border of a polar cap, and is not a crossing.
+    Centroids are returned in [-180, 180].
+
+    Parameters
+    ----------
+    rings : numpy.ndarray
+        Array of LinearRing.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        Longitudes, latitudes and weights of the ring centroids. The weights
+        are the absolute areas of the rings; when every ring has a null area,
+        the centroids are the means of their vertices, weighted by their
+        number of vertices. Empty rings are left out.
+    """
+    nb_rings = len(rings)
+    coords, ring_index = shapely.get_coordinates(rings, return_index=True)
+    lons = coords[:, 0]
+    lats = coords[:, 1]
+
+    # Consecutive vertices of the same ring form the edges of the rings
+    is_edge = ring_index[:-1] == ring_index[1:]
+    edge_ring = ring_index[:-1][is_edge]
+
+    # Unwrap to [0, 360] the longitudes of the rings crossing the antimeridian
+    jumps = np.abs(np.diff(lons))[is_edge]
+    crossing_rings = np.unique(edge_ring[(jumps > 180) & (jumps < 360)])
+    is_unwrapped = np.isin(ring_index, crossing_rings) & (lons < 0)
+    lons = np.where(is_unwrapped, lons + 360, lons)
+
+    x0 = lons[:-1][is_edge]
+    x1 = lons[1:][is_edge]
+    y0 = lats[:-1][is_edge]
+    y1 = lats[1:][is_edge]
+
+    # Shoelace formula, reduced per ring
+    cross = x0 * y1 - x1 * y0
+    areas = 0.5 * np.bincount(edge_ring, weights=cross, minlength=nb_rings)
+    has_area = areas != 0
+
+    if np.any(has_area):
+        moments_x = np.bincount(
+            edge_ring, weights=(x0 + x1) * cross, minlength=nb_rings
+        )
+        moments_y = np.bincount(
+            edge_ring, weights=(y0 + y1) * cross, minlength=nb_rings
+        )
+        centroid_lons = moments_x[has_area] / (6 * areas[has_area])
+        centroid_lats = moments_y[has_area] / (6 * areas[has_area])
+        weights = np.abs(areas[has_area])
     else:
-        nb_points = len(geometry.exterior.coords)
-    return nb_points
+        # Degenerate rings: mean of the vertices, closing vertices excluded
+        counts = np.bincount(edge_ring, minlength=nb_rings)
+        has_vertices = counts > 0
+        weights = counts[has_vertices]
+        centroid_lons = (
+            np.bincount(edge_ring, weights=x0, minlength=nb_rings)[has_vertices]
+            / weights
+        )
+        centroid_lats = (
+            np.bincount(edge_ring, weights=y0, minlength=nb_rings)[has_vertices]
+            / weights
+        )
+
+    # Convert the centroids of unwrapped rings back to [-180, 180]
+    centroid_lons = np.where(centroid_lons > 180, centroid_lons - 360, centroid_lons)
+    return centroid_lons, centroid_lats, weights
 
 
 def compute_centroid(geometry: Polygon | MultiPolygon) -> tuple[float, float]:
     """
     Compute the centroid of a Polygon or MultiPolygon, taking into account
-    geometries that cross the antimeridian. Longitudes are normalized to
-    [0, 360] before computing the mean and converted back to [-180, 180].
+    geometries that cross the antimeridian.
+
+    The centroid of the exterior ring of each part is given by the shoelace
+    formula, the longitudes of a part crossing the antimeridian being
+    unwrapped to [0, 360] first (see ``_ring_centroids``). The centroids of
+    the parts are then combined, weighted by their area: latitudes with an
+    arithmetic mean, longitudes with a circular mean (``atan2`` of the mean
+    sine and cosine), so that parts on both sides of the antimeridian, such
+    as the halves of a split footprint, average to ±180° instead of 0°.
 
     Parameters
     ----------
@@ -222,32 +374,19 @@ def compute_centroid(geometry: Polygon | MultiPolygon) -> tuple[float, float]:
     Returns
     -------
     Tuple[float, float]
-        The (longitude, latitude) of the centroid.
+        The (longitude, latitude) of the centroid, NaN for an empty geometry.
     """
-    lons = []
-    lats = []
-
-    if isinstance(geometry, Polygon):
-        # Normalize longitudes to [0, 360] to handle antimeridian crossing
-        geom = normalize_lon_to_360(geometry)
-        lons_poly, lats_poly = geom.exterior.xy
-        lons.extend(lons_poly)
-        lats.extend(lats_poly)
-    elif isinstance(geometry, MultiPolygon):
-        # Iterate over each polygon in the multipolygon
-        for poly in geometry.geoms:
-            geom = normalize_lon_to_360(poly)
-            lons_poly, lats_poly = geom.exterior.xy
-            lons.extend(lons_poly)
-            lats.extend(lats_poly)
-    else:
+    if not isinstance(geometry, (Polygon, MultiPolygon)):
         raise UnsupportedGeometryTypeError(type(geometry))
 
-    # Compute mean longitude and latitude
-    lon_mean = np.mean(lons[:-1])
-    if lon_mean >= 180:
-        # Convert back to [-180, 180] if needed
-        lon_mean = 180 - lon_mean
-    lat_mean = np.mean(lats[:-1])
+    exteriors = shapely.get_exterior_ring(shapely.get_parts(geometry))
+    lons, lats, weights = _ring_centroids(exteriors)
+    if len(weights) == 0:
+        return float("nan"), float("nan")
 
-    return lon_mean, lat_mean
+    lons_rad = np.deg2rad(lons)
+    lon_mean = np.rad2deg(
+        np.arctan2(np.dot(weights, np.sin(lons_rad)), np.dot(weights, np.cos(lons_rad)))
+    )
+    lat_mean = np.average(lats, weights=weights)
+    return float(lon_mean), float(lat_mean)
@@ -16,15 +16,18 @@ AntimeridianLineSplitter
 AntimeridianSplitter
     Detects and splits geometries crossing the antimeridian.
 """
+import numpy as np
+import shapely
+from shapely import GeometryType
+from shapely import STRtree
 from shapely.geometry import LineString
 from shapely.geometry import MultiLineString
 from shapely.geometry import MultiPoint
 from shapely.geometry import MultiPolygon
 from shapely.geometry import Point
 from shapely.geometry import Polygon
-from shapely.ops import orient
 from shapely.ops import split
-from shapely.ops import unary_union
+from shapely.prepared import prep
 
 from .angle_operation import normalize_lon_to_180
 from .angle_operation import normalize_lon_to_360
@@ -53,6 +56,8 @@ class EquatorSplitter:
             (LONGITUDE_EST, EQUATOR_LATITUDE),
         ]
     )
+    # Prepared once: the equator is the constant side of every intersection test
+    EQUATOR_LINE_PREPARED = prep(EQUATOR_LINE)
 
     def __init__(self, geometry: Polygon):
         """
@@ -65,6 +70,30 @@ class EquatorSplitter:
         """
         self.geometry = geometry
 
+    @staticmethod
+    def _crosses_equator(geometry: Polygon) -> bool:
+        """
+        Check whether the equator may split the polygon.
+
+        Parameters
+        ----------
+        geometry : Polygon
+            Input polygon in WGS84 coordinates.
+
+        Returns
+        -------
+        bool
+            False when the polygon lies on one side of the equator (it may
+            touch it), True otherwise.
+        """
+        _, min_lat, _, max_lat = geometry.bounds
+        if (
+            min_lat >= EquatorSplitter.EQUATOR_LATITUDE
+            or max_lat <= EquatorSplitter.EQUATOR_LATITUDE
+        ):
+            return False
+        return EquatorSplitter.EQUATOR_LINE_PREPARED.intersects(geometry)
+
     @UtilsMonitoring.time_spend(level="DEBUG")
     def make_valid_geojson_geometry(self) -> Polygon | MultiPolygon:
         """
@@ -72,65 +101,49 @@ class EquatorSplitter:
         Polygons containing a pole are delegated to the Pole class.
         Other polygons are handled by AntimeridianSplitter if needed.
 
-        If no piece contains a pole, each piece is handled by AntimeridianSplitter
-        and the results are combined. A unary_union is attempted to merge the pieces
-        into a single polygon if possible.
+        If no piece contains a pole, each piece is handled by AntimeridianSplitter.
+        The results are then combined: disjoint pieces are assembled as a
+        MultiPolygon, otherwise a union merges them into a single polygon
+        if possible.
+
+        A polygon lying entirely on one side of the equator (bounding box test,
+        then an intersection test against the prepared equator line) is not
+        split: it is handled directly as a single piece.
 
         Returns
         -------
         Polygon or MultiPolygon
             Valid GeoJSON-ready geometry.
         """
+        if not self._crosses_equator(self.geometry):
+            logger.debug("Polygon does not cross the equator. No split needed.")
+            pole: Pole = PoleFactory.create(self.geometry)
+            if pole.is_pole_included:
+                valid_geom = pole.make_valid_geojson_geometry()
+            else:
+                antimeridian = AntimeridianSplitter(self.geometry)
+                valid_geom = antimeridian.make_valid_geojson_geometry()
+            return self._merge_polygons(self._flatten_polygons([valid_geom]))
+
         logger.debug("Splitting polygon along equator...")
-        geometry_collection = split(self.geometry, EquatorSplitter.EQUATOR_LINE)
-        logger.debug("Equator split produced {} parts.", len(geometry_collection.geoms))
+        split_geometries = list(
+            split(self.geometry, EquatorSplitter.EQUATOR_LINE).geoms
+        )
+        logger.debug("Equator split produced {} parts.", len(split_geometries))
 
-        # Check if at least one piece contains a pole
-        any_pole_included = False
-        for geom in geometry_collection.geoms:
-            pole: Pole = PoleFactory.create(geom)
-            if pole.is_pole_included:
-                any_pole_included = True
-                break
+        # Check if at least one piece contains a pole. Each Pole projects its
+        # piece to polar coordinates, so poles are built once and reused below.
+        poles: list[Pole] = PoleFactory.create_many(split_geometries)
+        any_pole_included = any(pole.is_pole_included for pole in poles)
 
         if not any_pole_included:
             logger.debug(
                 "No pole included in any part after equator split. "
                 "Processing each part with AntimeridianSplitter."
             )
-            all_polygons = []
-            for geom in geometry_collection.geoms:
-                antimeridian = AntimeridianSplitter(geom)
-                valid_geom = antimeridian.make_valid_geojson_geometry()
-                if valid_geom.geom_type == "Polygon":
-                    all_polygons.append(valid_geom)
-                elif valid_geom.geom_type == "MultiPolygon":
-                    all_polygons.extend(list(valid_geom.geoms))
-
-            if len(all_polygons) == 1:
-                return all_polygons[0]
-
-            result = unary_union(MultiPolygon(all_polygons))
-            if isinstance(result, Polygon) and result.is_valid and not result.is_empty:
-                logger.debug("unary_union merged pole parts into a single Polygon.")
-                return result
-            if (
-                isinstance(result, MultiPolygon)
-                and result.is_valid
-                and not result.is_empty
-            ):
-                logger.debug(
-                    "unary_union produced a valid MultiPolygon from pole parts."
-                )
-                return result
-            raise InvalidGeoJSONGeometryError(
-                result.geom_type, f"valid={result.is_valid}, empty={result.is_empty}"
-            )
 
-        # At least one piece contains a pole → process each piece
         geom_validated = []
-        for geom in geometry_collection.geoms:
-            pole: Pole = PoleFactory.create(geom)
+        for geom, pole in zip(split_geometries, poles):
             if pole.is_pole_included:
                 geom_validated.append(pole.make_valid_geojson_geometry())
             else:
@@ -138,27 +151,78 @@ class EquatorSplitter:
                 valid_geom = antimeridian.make_valid_geojson_geometry()
                 geom_validated.append(valid_geom)
 
-        # Flatten
+        return self._merge_polygons(self._flatten_polygons(geom_validated))
+
+    @staticmethod
+    def _flatten_polygons(geometries: list[Polygon | MultiPolygon]) -> list[Polygon]:
+        """
+        Flatten the processed pieces into a list of polygons.
+
+        Parameters
+        ----------
+        geometries : list of Polygon or MultiPolygon
+            Pieces returned by the Pole or AntimeridianSplitter processing.
+
+        Returns
+        -------
+        list of Polygon
+            Polygons of the pieces, MultiPolygons being expanded.
+        """
         all_polygons = []
-        for geom in geom_validated:
-            if geom.geom_type == "Polygon":
+        for geom, type_id in zip(geometries, shapely.get_type_id(geometries)):
+            if type_id == GeometryType.POLYGON:
                 all_polygons.append(geom)
-            elif geom.geom_type == "MultiPolygon":
-                all_polygons.extend(list(geom.geoms))
+            elif type_id == GeometryType.MULTIPOLYGON:
+                all_polygons.extend(geom.geoms)
+        return all_polygons
 
-        if len(all_polygons) == 1:
-            return all_polygons[0]
+    @staticmethod
+    def _merge_polygons(polygons: list[Polygon]) -> Polygon | MultiPolygon:
+        """
+        Combine the processed pieces into a single valid geometry.
+
+        Pieces that are valid and pairwise disjoint already form a valid
+        MultiPolygon, so they are assembled directly; the (costly) overlay of
+        ``union_all`` is only run when some pieces intersect, typically
+        the two halves of an equator split that share an edge.
 
-        result = unary_union(MultiPolygon(all_polygons))
-        if isinstance(result, Polygon) and result.is_valid and not result.is_empty:
-            logger.debug("unary_union produced a valid Polygon.")
+        Parameters
+        ----------
+        polygons : list of Polygon
+            Pieces to combine.
+
+        Returns
+        -------
+        Polygon or MultiPolygon
+            Valid GeoJSON-ready geometry.
+
+        Raises
+        ------
+        InvalidGeoJSONGeometryError
+            If the union of the pieces is not a valid, non-empty geometry.
+        """
+        if len(polygons) == 1:
+            return polygons[0]
+
+        tree = STRtree(polygons)
+        left, right = tree.query(polygons, predicate="intersects")
+        if not (left != right).any() and shapely.is_valid(polygons).all():
+            logger.debug("Pieces are pairwise disjoint. No union needed.")
+            return MultiPolygon(polygons)
+
+        # Union the pieces directly, without wrapping them in a MultiPolygon
+        result = shapely.union_all(polygons)
+        is_valid = result.is_valid
+        is_empty = result.is_empty
+        if isinstance(result, Polygon) and is_valid and not is_empty:
+            logger.debug("union_all produced a valid Polygon.")
             return result
-        if isinstance(result, MultiPolygon) and result.is_valid and not result.is_empty:
-            logger.debug("unary_union produced a valid MultiPolygon.")
+        if isinstance(result, MultiPolygon) and is_valid and not is_empty:
+            logger.debug("union_all produced a valid MultiPolygon.")
             return result
 
         raise InvalidGeoJSONGeometryError(
-            result.geom_type, f"valid={result.is_valid}, empty={result.is_empty}"
+            result.geom_type, f"valid={is_valid}, empty={is_empty}"
         )
 
 
@@ -194,11 +258,12 @@ class AntimeridianLineSplitter:
         result: Point | MultiPoint | LineString | MultiLineString = (
             self.line.intersection(AntimeridianSplitter.ANTI_MERIDIAN_LINE)
         )
-        if isinstance(result, Point):
+        type_id = shapely.get_type_id(result)
+        if type_id == GeometryType.POINT:
             return result
-        elif isinstance(result, MultiPoint):
+        elif type_id == GeometryType.MULTIPOINT:
             return result.geoms[1]
-        elif isinstance(result, MultiLineString):
+        elif type_id == GeometryType.MULTILINESTRING:
             first_line = result.geoms[0]
             first_point_coords = first_line.coords[1]
             first_point = Point(first_point_coords)
@@ -226,6 +291,10 @@ class AntimeridianSplitter:
         ]
     )
 
+    # Number of consecutive longitude steps checked at once when looking for
+    # an antimeridian crossing
+    CROSSING_CHUNK_SIZE = 4096
+
     def __init__(self, geometry: Polygon):
         """
         Parameters
@@ -257,14 +326,24 @@ class AntimeridianSplitter:
         -------
         bool
         """
-        exterior = geometry.exterior.coords
-        for (lon1, _), (lon2, _) in zip(exterior, exterior[1:]):
-            diff = abs(lon2 - lon1)
+        lons = shapely.get_coordinates(geometry.exterior)[:, 0]
+        chunk_size = AntimeridianSplitter.CROSSING_CHUNK_SIZE
+        # Scan the ring by chunks (overlapping by one vertex) so that a
+        # crossing near the start is found without diffing the whole ring
+        for start in range(0, len(lons) - 1, chunk_size):
+            diff = np.abs(np.diff(lons[start : start + chunk_size + 1]))
             # True crossing: diff > 180 but not 360
             # diff = 360 means both points are at ±180 (same meridian, not a crossing)
-            if 180 < diff < 360:
-                logger.debug("Detected antimeridian crossing: {} -> {}", lon1, lon2)
+            crossings = (diff > 180) & (diff < 360)
+            if crossings.any():
+                index = start + int(np.argmax(crossings))
+                logger.debug(
+                    "Detected antimeridian crossing: {} -> {}",
+                    lons[index],
+                    lons[index + 1],
+                )
                 return True
+
         return False
 
     @staticmethod
@@ -279,8 +358,37 @@ class AntimeridianSplitter:
         Returns
         -------
         bool
+
+        Notes
+        -----
+        Only the maximum longitude matters, so the check reads the polygon
+        envelope computed by GEOS instead of copying and scanning every
+        vertex. Holes lie within the exterior ring and do not change it.
+        """
+        _, _, max_lon, _ = polygon.bounds
+        return bool(max_lon > 180)
+
+    @staticmethod
+    def _normalize_part_to_180(part: Polygon) -> Polygon:
         """
-        return any(x > 180 for x, _ in polygon.exterior.coords)
+        Bring a part of a 0–360° split back to [-180, 180].
+
+        Parts lying in the 180–360° half (see ``contains_lon_gt_180``) are
+        shifted with ``normalize_lon_to_180`` in 360° space; the other parts
+        are already in range and are returned unchanged.
+
+        Parameters
+        ----------
+        part : Polygon
+            Polygon produced by splitting a 0–360° geometry at 180°.
+
+        Returns
+        -------
+        Polygon
+        """
+        if not AntimeridianSplitter.contains_lon_gt_180(part):
+            return part
+        return normalize_lon_to_180(part, is_360_space=True)
 
     # -------------------------------------------------------------------------
     # Main splitter logic
@@ -303,21 +411,29 @@ class AntimeridianSplitter:
 
         # Normalize to 0–360° longitude for easier splitting
         geom_360 = normalize_lon_to_360(self.geometry)
-        geometry_collection = split(geom_360, AntimeridianSplitter.ANTI_MERIDIAN_LINE)
-        split_geometries = geometry_collection.geoms
+        # shapely.ops.split already prepares the polygon before testing which
+        # polygonized faces it contains, so no extra prep() is needed here
+        split_geometries = split(
+            geom_360, AntimeridianSplitter.ANTI_MERIDIAN_LINE
+        ).geoms
 
         logger.debug("Geometry split into {} parts.", len(split_geometries))
 
-        corrected_parts = []
-        for part in split_geometries:
-            if self.contains_lon_gt_180(part):
-                corrected = normalize_lon_to_180(part, is_360_space=True)
-            else:
-                corrected = normalize_lon_to_180(part, is_360_space=False)
+        corrected_parts = np.array(
+            [self._normalize_part_to_180(part) for part in split_geometries],
+            dtype=object,
+        )
 
-            corrected_parts.append(orient(corrected))
+        # Only reorient parts that need it: a part without holes whose
+        # exterior is already counter-clockwise is kept as is
+        is_oriented = shapely.is_ccw(shapely.get_exterior_ring(corrected_parts)) & (
+            shapely.get_num_interior_rings(corrected_parts) == 0
+        )
+        corrected_parts[~is_oriented] = shapely.orient_polygons(
+            corrected_parts[~is_oriented]
+        )
 
         if len(corrected_parts) == 1:
             return corrected_parts[0]
 
-        return MultiPolygon(corrected_parts)
+        return MultiPolygon(list(corrected_parts))
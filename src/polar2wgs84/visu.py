@@ -8,6 +8,7 @@ using Matplotlib and Cartopy. Supports line and point plotting modes.
 """
 import cartopy.crs as ccrs
 import matplotlib.pyplot as plt
+import shapely
 from shapely.geometry import MultiPolygon
 from shapely.geometry import Polygon
 
@@ -20,6 +21,13 @@ class GeometryVisualizer:
     using Cartopy coordinate reference systems.
     """
 
+    # Gridlines are always drawn in PlateCarree: build the CRS once
+    PLATE_CARREE = ccrs.PlateCarree()
+
+    # Above this number of vertices, points are drawn as the markers of a
+    # single line instead of a scatter collection
+    SCATTER_MAX_POINTS = 10_000
+
     @staticmethod
     def draw_geometry(
         ax: plt.Axes,
@@ -30,6 +38,7 @@ class GeometryVisualizer:
         edgecolor: str = "black",
         point_size: int = 15,
         linewidth: float = 2,
+        draw_base: bool = True,
     ):
         """
         Draw a Polygon or MultiPolygon on a Matplotlib axis with Cartopy.
@@ -52,6 +61,9 @@ class GeometryVisualizer:
             Size of points when mode is not "lines" (default: 15).
         linewidth : float, optional
             Width of polygon edges when mode is "lines" (default: 2).
+        draw_base : bool, optional
+            Draw coastlines and gridlines under the geometry (default: True).
+            Disable it for quick, non-interactive renderings.
 
         Raises
         ------
@@ -60,19 +72,20 @@ class GeometryVisualizer:
         """
         ax.set_title(title)
         ax.set_global()
-        ax.coastlines(linewidth=0.5, color="gray")
+        if draw_base:
+            ax.coastlines(linewidth=0.5, color="gray")
 
-        # Draw gridlines
-        gl1 = ax.gridlines(
-            crs=ccrs.PlateCarree(),
-            draw_labels=True,
-            linewidth=0.5,
-            color="gray",
-            alpha=0.5,
-            linestyle="--",
-        )
-        gl1.top_labels = False
-        gl1.right_labels = False
+            # Draw gridlines
+            gl1 = ax.gridlines(
+                crs=GeometryVisualizer.PLATE_CARREE,
+                draw_labels=True,
+                linewidth=0.5,
+                color="gray",
+                alpha=0.5,
+                linestyle="--",
+            )
+            gl1.top_labels = False
+            gl1.right_labels = False
 
         if mode == "lines":
             # Draw geometry edges
@@ -85,22 +98,26 @@ class GeometryVisualizer:
             )
             return
 
-        # Collect all coordinates for scatter plot mode
-        coords = []
-        if isinstance(geom, Polygon):
-            coords = list(geom.exterior.coords)
-            for interior in geom.interiors:
-                coords += list(interior.coords)
-        elif isinstance(geom, MultiPolygon):
-            for p in geom.geoms:
-                coords += list(p.exterior.coords)
-                for interior in p.interiors:
-                    coords += list(interior.coords)
-        else:
+        if not isinstance(geom, (Polygon, MultiPolygon)):
             raise UnsupportedGeometryTypeError(type(geom))
 
+        # Collect all coordinates (exteriors and holes) for scatter plot mode
+        coords = shapely.get_coordinates(geom)
+
         # Plot vertices as points
-        if coords:
-            xs = [x for x, y in coords]
-            ys = [y for x, y in coords]
-            ax.scatter(xs, ys, s=point_size, color=edgecolor, transform=crs)
+        if len(coords) > GeometryVisualizer.SCATTER_MAX_POINTS:
+            # A Line2D shares one marker path for all vertices, which is much
+            # cheaper to draw than a PathCollection with one path per point
+            ax.plot(
+                coords[:, 0],
+                coords[:, 1],
+                linestyle="",
+                marker="o",
+                markersize=point_size**0.5,
+                color=edgecolor,
+                transform=crs,
+            )
+        elif len(coords):
+            ax.scatter(
+                coords[:, 0], coords[:, 1], s=point_size, color=edgecolor, transform=crs
+            )
@@ -0,0 +1,191 @@
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import shapely
+from shapely.geometry import MultiPolygon
+from shapely.geometry import Polygon
+from shapely.geometry import shape
+
+# Geometries shared by the acceptance tests. This module only depends on
+# shapely so that the profiling run does not import cartopy nor matplotlib.
+
+try:
+    # Optional: orjson decodes the large footprint files much faster
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+@lru_cache(maxsize=None)
+def _load_from_disk(file_name):
+    # Parsed once per file and session: shapely geometries are immutable,
+    # so the same object can be shared by every test using the file
+    my_directory = Path(__file__).resolve().parent
+    file_path = my_directory / file_name
+    data = _json_loads(file_path.read_bytes())
+    return shape(data["features"][0]["geometry"])
+
+
+def load_polygon(geometry):
+    # Inline geometries are stored as coordinate sequences so that no GEOS
+    # object is built at import time, only when a test actually runs
+    if not isinstance(geometry, str):
+        return shapely.polygons(
+            shapely.linearrings(np.asarray(geometry, dtype=np.float64))
+        )
+    return _load_from_disk(geometry)
+
+
+def _coords(points):
+    # Vertices are stored as a single float32 array per polygon, half the
+    # memory of float64; the inline vertices are integers, so the values are
+    # exact and load_polygon upcasts them to float64 for GEOS
+    return np.asarray(points, dtype=np.float32)
+
+
+# Liste des géométries à tester, avec leurs paramètres associés
+test_geometries = [
+    {
+        "name": "Footprint1",
+        "poly": "footprint1.json",
+    },
+    {
+        "name": "Footprint3",
+        "poly": "footprint3.json",
+    },
+    {
+        "name": "Footprint4",
+        "poly": "footprint4.json",
+    },
+    {
+        "name": "Footprint5",
+        "poly": "footprint5.json",
+    },
+    {
+        "name": "Footprint6",
+        "poly": "footprint6.json",
+    },
+    {
+        "name": "Footprint7",
+        "poly": "footprint7.json",
+    },
+    {
+        "name": "Footprint8",
+        "poly": "footprint8.json",
+    },
+    {
+        "name": "Footprint9",
+        "poly": "footprint9.json",
+    },
+    {
+        "name": "Footprint11",
+        "poly": "footprint11.json",
+    },
+    {
+        "name": "Footprint12",
+        "poly": "footprint12.json",
+    },
+    {
+        "name": "Footprint17",
+        "poly": "footprint17.json",
+    },
+    {
+        "name": "Footprint18",
+        "poly": "footprint18.json",
+    },
+    {
+        "name": "Footprint19",
+        "poly": "footprint19.json",
+    },
+    {
+        "name": "On Antimeridian",
+        "poly": _coords(
+            [
+                (180, 60),
+                (180, 70),
+                (175, 70),
+                (175, 60),
+                (180, 60),
+            ]
+        ),
+    },
+    {
+        "name": "Simple Antimeridian",
+        "poly": _coords(
+            [
+                (170, 60),  # Point de départ
+                (179, 60),  # Traverse l'antiméridien
+                (-170, 60),  # Après l'antiméridien
+                (-160, 70),
+                (150, 80),
+                (170, 60),
+            ]
+        ),
+    },
+    {
+        "name": "Antimeridian North Pole",
+        "poly": _coords(
+            [
+                (170, 60),  # Point de départ
+                (180, 60),  # Traverse l'antiméridien
+                (-170, 60),  # Après l'antiméridien
+                (-160, 70),
+                (-150, 80),
+                (-140, 85),
+                (180, 89),  # Pôle Nord
+                (140, 85),
+                (150, 80),
+                (160, 70),
+                (170, 60),  # Retour au point de départ pour fermer le polygone
+            ]
+        ),
+    },
+    {
+        "name": "Small Arctic Polygon",
+        "poly": _coords([(0, 80), (30, 80), (60, 80), (-30, 85), (0, 80)]),
+    },
+    {
+        "name": "Complex Antarctic Polygon",
+        "poly": _coords(
+            [
+                (0, -80),
+                (30, -85),
+                (60, -80),
+                (90, -75),
+                (110, -80),
+                (-110, -80),
+                (-90, -75),
+                (-45, -80),
+                (-20, -75),
+                (0, -80),
+            ]
+        ),
+    },
+    {
+        "name": "S",
+        "poly": _coords(
+            [
+                (150, 50),
+                (-170, 50),
+                (-170, 40),
+                (170, 40),
+                (170, 30),
+                (-170, 30),
+                (-170, 0),
+                (150, 0),
+                (150, 10),
+                (160, 10),
+                (160, 20),
+                (150, 20),
+                (150, 50),
+            ]
+        ),
+    },
+]
+
+
+def compute_nbpoints(geometry: Polygon | MultiPolygon):
+    # Number of exterior vertices over all the parts, counted by GEOS
+    exteriors = shapely.get_exterior_ring(shapely.get_parts(geometry))
+    return int(shapely.get_num_coordinates(exteriors).sum())
@@ -0,0 +1,21 @@
+import pytest
+import shapely
+from polar2wgs84.footprint import Footprint
+
+
+@pytest.fixture(scope="session")
+def processed_footprint():
+    # Memoizes the whole pipeline (valid geometry, then densified Plate Carrée
+    # one) per geometry name and content, so that acceptance tests sharing a
+    # geometry in the session only compute it once
+    cache = {}
+
+    def _process(name, polygon):
+        key = (name, shapely.to_wkb(polygon))
+        if key not in cache:
+            footprint = Footprint(polygon)
+            geom_wgs84 = footprint.make_valid_geojson_geometry()
+            cache[key] = (geom_wgs84, footprint.to_wgs84_plate_carre(geom_wgs84))
+        return cache[key]
+
+    return _process
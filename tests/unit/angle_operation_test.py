@@ -129,6 +129,23 @@ def test_normalize_lon_to_180_polygon():
     assert all(-180 <= x <= 180 for x in xs)
 
 
+def test_normalize_lon_keeps_z():
+    line = LineString([(-170, 10, 5), (170, 20, 6)])
+
+    norm_360 = normalize_lon_to_360(line)
+    norm_180 = normalize_lon_to_180(norm_360, is_360_space=True)
+
+    assert list(norm_360.coords) == [(190, 10, 5), (170, 20, 6)]
+    assert list(norm_180.coords) == [(-170, 10, 5), (170, 20, 6)]
+
+
+def test_normalize_lon_keeps_2d_geometries_2d():
+    line = LineString([(-170, 10), (170, 20)])
+
+    assert not normalize_lon_to_360(line).has_z
+    assert not normalize_lon_to_180(line).has_z
+
+
 # -----------------------------------------------------------------------------
 # Round-trip consistency
 # -----------------------------------------------------------------------------
@@ -1,6 +1,5 @@
 import numpy as np
 import pytest
-from polar2wgs84.densify_geometry import _densify_segment_km
 from polar2wgs84.densify_geometry import _lonlat_to_unit
 from polar2wgs84.densify_geometry import _unit_to_lonlat
 from polar2wgs84.densify_geometry import DensifyGeometryGeodesic
@@ -94,53 +93,94 @@ def test_lonlat_to_unit_and_back_roundtrip(lon, lat):
     assert np.isclose(lat, lat2, atol=1e-6)
 
 
-def test_densify_segment_zero_length(simple_square_polygon):
+# -----------------------------------------------------------------------------
+# Ring densification
+# -----------------------------------------------------------------------------
+
+
+def test_densify_ring_preserves_closure(simple_square_polygon):
     densifier = DensifyGeometryGeodesic(simple_square_polygon)
 
-    pts = _densify_segment_km(
-        lon0=0,
-        lat0=0,
-        lon1=0,
-        lat1=0,
-        max_step_km=10,
-        radius_planet=densifier.R_EARTH_KM,
+    coords = list(simple_square_polygon.exterior.coords)
+    densified = densifier._densify_ring_km(
+        coords, max_step_km=50, radius_planet=densifier.R_EARTH_KM
     )
 
-    assert np.allclose(pts, np.array([[0.0, 0.0]]))
+    assert np.array_equal(densified[0], densified[-1])
+    assert len(densified) > len(coords)
 
 
-def test_densify_segment_increases_points(simple_square_polygon):
+@pytest.mark.parametrize("is_closed", [True, False])
+def test_densify_ring_does_not_duplicate_closing_vertex(
+    simple_square_polygon, is_closed
+):
     densifier = DensifyGeometryGeodesic(simple_square_polygon)
 
-    pts = _densify_segment_km(
-        lon0=0,
-        lat0=0,
-        lon1=10,
-        lat1=0,
-        max_step_km=100,
-        radius_planet=densifier.R_EARTH_KM,
+    coords = list(simple_square_polygon.exterior.coords)
+    if not is_closed:
+        coords = coords[:-1]
+    densified = densifier._densify_ring_km(
+        coords, max_step_km=50, radius_planet=densifier.R_EARTH_KM
     )
 
-    assert len(pts) > 2
-    assert pts[0] == pytest.approx((0, 0))
-    assert pts[-1] == pytest.approx((10, 0))
+    assert np.array_equal(densified[0], densified[-1])
+    assert not np.array_equal(densified[-2], densified[-1])
 
 
-# -----------------------------------------------------------------------------
-# Ring densification
-# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("max_step_km", [100, 5000])
+def test_densify_ring_drops_repeated_points(simple_square_polygon, max_step_km):
+    # 5000 km is longer than every edge: the ring takes the no-densification path
+    densifier = DensifyGeometryGeodesic(simple_square_polygon)
+
+    coords = [(0, 0), (0, 0), (10, 0), (10, 10), (10, 10), (0, 0)]
+    densified = densifier._densify_ring_km(
+        coords, max_step_km=max_step_km, radius_planet=densifier.R_EARTH_KM
+    )
 
+    assert np.all(np.any(np.diff(densified, axis=0) != 0, axis=1))
+    assert np.array_equal(densified[0], densified[-1])
 
-def test_densify_ring_preserves_closure(simple_square_polygon):
+
+@pytest.mark.parametrize("max_step_km", [1, 10, 100, np.deg2rad(5) * 6371.0, 1000])
+def test_densify_ring_long_segment_is_subdivided(simple_square_polygon, max_step_km):
+    # deg2rad(5) * R is a 5° step: the 10° equator edge spans 2 steps exactly
+    densifier = DensifyGeometryGeodesic(simple_square_polygon)
+
+    coords = [(0, 0), (10, 0), (10, 10), (0, 0)]
+    densified = densifier._densify_ring_km(
+        coords, max_step_km=max_step_km, radius_planet=6371.0
+    )
+
+    # The equator edge gets at least two subdivisions, each shorter than the step
+    equator = densified[:-1][densified[:-1, 1] == 0]
+    assert len(equator) >= 3
+    assert equator[0] == pytest.approx((0, 0))
+    assert equator[-1] == pytest.approx((10, 0))
+    step_deg = np.rad2deg(max_step_km / 6371.0)
+    assert np.all(np.diff(equator[:, 0]) < step_deg)
+
+
+def test_densify_ring_keeps_polar_segment_endpoints(simple_square_polygon):
+    densifier = DensifyGeometryGeodesic(simple_square_polygon)
+
+    coords = [(0, 80), (0, 90), (90, 90), (90, 80), (0, 80)]
+    densified = densifier._densify_ring_km(
+        coords, max_step_km=100, radius_planet=densifier.R_EARTH_KM
+    )
+
+    polar = densified[densified[:, 1] >= 90 - 1e-10]
+    assert polar[:, 0] == pytest.approx([0, 90])
+
+
+def test_densify_ring_already_dense_is_unchanged(simple_square_polygon):
     densifier = DensifyGeometryGeodesic(simple_square_polygon)
 
     coords = list(simple_square_polygon.exterior.coords)
     densified = densifier._densify_ring_km(
-        coords, max_step_km=50, radius_planet=densifier.R_EARTH_KM
+        coords, max_step_km=500, radius_planet=densifier.R_EARTH_KM
     )
 
-    assert np.array_equal(densified[0], densified[-1])
-    assert len(densified) > len(coords)
+    assert np.array_equal(densified, np.asarray(coords))
 
 
 # -----------------------------------------------------------------------------
@@ -1,9 +1,10 @@
 import argparse
 import sys
-from unittest.mock import MagicMock
+from unittest.mock import create_autospec
 from unittest.mock import patch
 
 import pytest
+from shapely.geometry import Polygon
 
 
 # ============================================================================
@@ -61,7 +62,7 @@ def cli_args():
 @pytest.fixture
 def valid_polygon():
     """Mock minimal d'un Polygon shapely valide."""
-    polygon = MagicMock(name="Polygon")
+    polygon = create_autospec(Polygon, instance=True)
     polygon.wkt = "POLYGON ((0 0, 1 0, 1 1, 0 0))"
     return polygon
 
@@ -77,7 +78,7 @@ def mock_dependencies(cli_args, valid_polygon):
         # patch("polar2wgs84.__main__.configure_logging"),
         patch("polar2wgs84.__main__.SigintHandler"),
         patch(
-            "polar2wgs84.__main__.ast.literal_eval",
+            "polar2wgs84.__main__._parse_geometry",
             return_value=[(0, 0), (1, 0), (1, 1), (0, 0)],
         ),
         patch("polar2wgs84.__main__.Polygon", return_value=valid_polygon),
@@ -97,16 +98,24 @@ def mock_dependencies(cli_args, valid_polygon):
 # ============================================================================
 
 
-def test_str2bool():
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("yes", True),
+        ("true", True),
+        ("True", True),
+        ("t", True),
+        ("1", True),
+        ("no", False),
+        ("false", False),
+        ("False", False),
+        ("f", False),
+        ("0", False),
+    ],
+)
+def test_str2bool(value, expected):
     """Test de la conversion string -> bool."""
-    true_values = ["yes", "true", "True", "t", "1"]
-    false_values = ["no", "false", "False", "f", "0"]
-
-    for v in true_values:
-        assert polar2wgs84_main.str2bool(v) is True
-
-    for v in false_values:
-        assert polar2wgs84_main.str2bool(v) is False
+    assert polar2wgs84_main.str2bool(value) is expected
 
 
 def test_parse_cli_minimal():
@@ -122,6 +131,11 @@ def test_parse_cli_minimal():
         assert args.geometry == "[(0, 0), (1, 0), (1, 1), (0, 0)]"
 
 
+def test_parse_geometry():
+    points = polar2wgs84_main._parse_geometry("[(0, 0), (1, 0), (1, 1), (0, 0)]")
+    assert points == [(0, 0), (1, 0), (1, 1), (0, 0)]
+
+
 def test_run_nominal(mock_dependencies):
     """
     Test du chemin nominal :
@@ -1,5 +1,6 @@
 import numpy as np
 import pytest
+import shapely
 from polar2wgs84.pole import NorthPole
 from polar2wgs84.pole import Pole
 from polar2wgs84.pole import PoleFactory
@@ -14,7 +15,7 @@ from shapely.geometry import Polygon
 # -----------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def north_pole_polygon():
     """
     Simple polygon enclosing the North Pole.
@@ -30,7 +31,7 @@ def north_pole_polygon():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def south_pole_polygon():
     """
     Simple polygon enclosing the South Pole.
@@ -46,7 +47,7 @@ def south_pole_polygon():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def non_polar_polygon():
     """
     Polygon far from both poles.
@@ -79,6 +80,18 @@ def test_pole_factory_creates_south_pole(south_pole_polygon):
     assert pole.is_north is False
 
 
+def test_pole_factory_create_many_matches_create(
+    north_pole_polygon, south_pole_polygon, non_polar_polygon
+):
+    geometries = [north_pole_polygon, south_pole_polygon, non_polar_polygon]
+    poles = PoleFactory.create_many(geometries)
+
+    assert [type(pole) for pole in poles] == [
+        type(PoleFactory.create(geometry)) for geometry in geometries
+    ]
+    assert [pole.geometry for pole in poles] == geometries
+
+
 # -----------------------------------------------------------------------------
 # Pole initialization
 # -----------------------------------------------------------------------------
@@ -113,6 +126,19 @@ def test_is_pole_included_false_for_non_polar(non_polar_polygon):
     assert pole.is_pole_included is False
 
 
+def test_is_pole_included_skips_buffer_outside_bounding_box(mocker):
+    buffer = mocker.patch.object(Polygon, "buffer")
+    polar = Polygon([(10, 10), (20, 10), (20, 20), (10, 10)])
+
+    assert Pole._is_pole_included(polar) is False
+    buffer.assert_not_called()
+
+
+def test_is_pole_included_true_around_origin():
+    polar = Polygon([(-10, -10), (10, -10), (10, 10), (-10, 10), (-10, -10)])
+    assert Pole._is_pole_included(polar) is True
+
+
 def test_insert_all_sign_changes():
     line = LineString(
         [
@@ -136,6 +162,28 @@ def test_insert_all_sign_changes():
     assert len(coords) > len(line.coords)
 
 
+def test_insert_all_sign_changes_without_crossing_returns_line():
+    line = LineString([(10, 0), (20, 0), (30, 5)])
+    pole = PoleFactory.create(Polygon([(-10, 1), (10, 1), (10, 2), (-10, 2), (-10, 1)]))
+
+    assert pole._insert_all_sign_changes(line, Point(-180, 3)) is line
+
+
+def test_insert_all_sign_changes_ignores_zero_longitude():
+    line = LineString([(-10, 0), (0, 0), (10, 0), (-10, 5)])
+    pole = PoleFactory.create(Polygon([(-10, 1), (10, 1), (10, 2), (-10, 2), (-10, 1)]))
+
+    new_line = pole._insert_all_sign_changes(line, Point(-180, 3))
+
+    assert list(new_line.coords) == [
+        (-10, 0),
+        (0, 0),
+        (10, 0),
+        (-180, 3),
+        (-10, 5),
+    ]
+
+
 # -----------------------------------------------------------------------------
 # make_valid_geojson_geometry
 # -----------------------------------------------------------------------------
@@ -158,6 +206,18 @@ def test_make_valid_geojson_geometry_pole_case(north_pole_polygon):
     assert result.exterior.is_ccw
 
 
+def test_make_valid_geojson_geometry_south_pole_crossing_antimeridian():
+    polygon = Polygon(
+        [(170, -80), (-170, -80), (-100, -75), (0, -75), (100, -75), (170, -80)]
+    )
+    pole = SouthPole(polygon)
+    result = pole.make_valid_geojson_geometry()
+
+    assert result.is_valid
+    assert result.exterior.is_ccw
+    assert result.bounds == (-180, -90, 180, -75)
+
+
 def test_make_valid_geojson_geometry_closed_ring(north_pole_polygon):
     pole = NorthPole(north_pole_polygon)
     result = pole.make_valid_geojson_geometry()
@@ -175,6 +235,5 @@ def test_no_nan_coordinates_after_processing(north_pole_polygon):
     pole = NorthPole(north_pole_polygon)
     result = pole.make_valid_geojson_geometry()
 
-    for x, y in result.exterior.coords:
-        assert not np.isnan(x)
-        assert not np.isnan(y)
+    coords = shapely.get_coordinates(result)
+    assert np.isfinite(coords).all()
@@ -1,5 +1,6 @@
 import numpy as np
 import pytest
+import shapely
 from polar2wgs84.exception import UnsupportedGeometryTypeError
 from polar2wgs84.projection import compute_centroid
 from polar2wgs84.projection import compute_nbpoints
@@ -9,12 +10,26 @@ from shapely.geometry import MultiPolygon
 from shapely.geometry import Polygon
 
 
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+def _assert_coords_close(actual, expected):
+    """
+    Assert that two geometries have the same vertices, up to rounding errors.
+    """
+    np.testing.assert_allclose(
+        shapely.get_coordinates(actual), shapely.get_coordinates(expected), atol=1e-9
+    )
+
+
 # -----------------------------------------------------------------------------
 # Fixtures
 # -----------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def simple_polygon():
     """
     Simple square polygon in WGS84.
@@ -30,7 +45,7 @@ def simple_polygon():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def antimeridian_polygon():
     """
     Polygon crossing the antimeridian.
@@ -46,7 +61,7 @@ def antimeridian_polygon():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def multipolygon(simple_polygon):
     """
     Simple MultiPolygon composed of two shifted polygons.
@@ -63,7 +78,7 @@ def multipolygon(simple_polygon):
     return MultiPolygon([simple_polygon, poly2])
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def projection():
     return Projection()
 
@@ -73,31 +88,43 @@ def projection():
 # -----------------------------------------------------------------------------
 
 
-def test_project_to_plate_carree_roundtrip(simple_polygon, projection):
-    projected = projection.project_to_plate_carree(simple_polygon)
-    restored = projection.project_to_plate_carree(projected, reverse=True)
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("project_to_plate_carree", {}),
+        ("project_to_polar", {"is_north": True}),
+        ("project_to_polar", {"is_north": False}),
+    ],
+    ids=["plate_carree", "polar_north", "polar_south"],
+)
+def test_projection_roundtrip(simple_polygon, projection, method, kwargs):
+    project = getattr(projection, method)
+    projected = project(simple_polygon, **kwargs)
+    restored = project(projected, reverse=True, **kwargs)
 
     assert isinstance(restored, Polygon)
     assert restored.is_valid
-    assert pytest.approx(restored.area, rel=1e-6) == simple_polygon.area
+    _assert_coords_close(restored, simple_polygon)
 
 
-def test_project_to_polar_north_roundtrip(simple_polygon, projection):
-    projected = projection.project_to_polar(simple_polygon, is_north=True)
+def test_projection_keeps_z(projection):
+    polygon = Polygon([(-10, 10, 1), (10, 10, 2), (10, 20, 3), (-10, 10, 1)])
+    projected = projection.project_to_polar(polygon, is_north=True)
     restored = projection.project_to_polar(projected, is_north=True, reverse=True)
 
-    assert isinstance(restored, Polygon)
-    assert restored.is_valid
-    assert pytest.approx(restored.area, rel=1e-6) == simple_polygon.area
+    assert projected.has_z
+    np.testing.assert_allclose(
+        shapely.get_coordinates(restored, include_z=True),
+        shapely.get_coordinates(polygon, include_z=True),
+        atol=1e-9,
+    )
 
 
-def test_project_to_polar_south_roundtrip(simple_polygon, projection):
-    projected = projection.project_to_polar(simple_polygon, is_north=False)
-    restored = projection.project_to_polar(projected, is_north=False, reverse=True)
+def test_projection_leaves_input_unchanged(multipolygon, projection):
+    coords = shapely.get_coordinates(multipolygon).copy()
+    projection.project_to_polar(multipolygon, is_north=True)
 
-    assert isinstance(restored, Polygon)
-    assert restored.is_valid
-    assert pytest.approx(restored.area, rel=1e-6) == simple_polygon.area
+    np.testing.assert_array_equal(shapely.get_coordinates(multipolygon), coords)
 
 
 def test_projection_with_multipolygon(multipolygon, projection):
@@ -106,6 +133,25 @@ def test_projection_with_multipolygon(multipolygon, projection):
 
     assert isinstance(restored, MultiPolygon)
     assert len(restored.geoms) == 2
+    _assert_coords_close(restored, multipolygon)
+
+
+def test_projection_transform_aliases(projection):
+    assert Projection.WGS84_TO_POLAR_NORTH.__self__ is projection._to_north
+    assert Projection.POLAR_SOUTH_TO_WGS84.__self__ is projection._from_south
+    assert projection.PLATE_CARREE_TO_WGS84.__self__ is projection._from_plate_carree
+
+    x, y = Projection.WGS84_TO_PLATE_CARREE(10.0, 20.0)
+    lon, lat = Projection.PLATE_CARREE_TO_WGS84(x, y)
+    assert (lon, lat) == pytest.approx((10.0, 20.0))
+
+
+def test_projection_instances_share_transformers(projection):
+    other = Projection()
+
+    assert other._to_north is projection._to_north
+    assert other._from_south is projection._from_south
+    assert other._to_plate_carree is projection._to_plate_carree
 
 
 # -----------------------------------------------------------------------------
@@ -143,6 +189,17 @@ def test_compute_nbpoints_multipolygon(multipolygon):
     assert nb == expected
 
 
+def test_compute_nbpoints_ignores_interiors():
+    hole = [(-5, 12), (5, 12), (5, 18), (-5, 12)]
+    poly = Polygon([(-10, 10), (10, 10), (10, 20), (-10, 20), (-10, 10)], [hole])
+    assert compute_nbpoints(poly) == 5
+
+
+def test_compute_nbpoints_invalid_type():
+    with pytest.raises(UnsupportedGeometryTypeError):
+        compute_nbpoints("not a geometry")  # type: ignore
+
+
 # -----------------------------------------------------------------------------
 # compute_centroid
 # -----------------------------------------------------------------------------
@@ -166,7 +223,32 @@ def test_compute_centroid_antimeridian_polygon(antimeridian_polygon):
     assert -90 <= lat <= 90
 
     # Centroid longitude should be near ±180, not ~0
-    assert abs(abs(lon) - 0) < 1e-6
+    assert np.isclose(lon, 180.0) or np.isclose(lon, -180.0)
+    assert np.isclose(lat, 15.0)
+
+
+def test_compute_centroid_antimeridian_polygon_off_centre():
+    poly = Polygon([(170, 10), (-160, 10), (-160, 20), (170, 20), (170, 10)])
+    lon, lat = compute_centroid(poly)
+
+    assert np.isclose(lon, -175.0)
+    assert np.isclose(lat, 15.0)
+
+
+def test_compute_centroid_is_area_weighted():
+    # The extra vertex on the left edge would bias a mean of the vertices
+    poly = Polygon([(0, 0), (10, 0), (10, 10), (0, 10), (0, 5), (0, 0)])
+    lon, lat = compute_centroid(poly)
+
+    assert pytest.approx(lon, abs=1e-6) == 5
+    assert pytest.approx(lat, abs=1e-6) == 5
+
+
+def test_compute_centroid_greenwich_polygon_is_not_unwrapped():
+    poly = Polygon([(-20, 10), (10, 10), (10, 20), (-20, 20), (-20, 10)])
+    lon, lat = compute_centroid(poly)
+
+    assert pytest.approx(lon, abs=1e-6) == -5
     assert pytest.approx(lat, abs=1e-6) == 15
 
 
@@ -176,6 +258,41 @@ def test_compute_centroid_multipolygon(multipolygon):
     assert -180 <= lon <= 180
     assert -90 <= lat <= 90
 
+    # Parts of 200 and 100 square degrees centred on (0, 15) and (25, 15):
+    # area-weighted circular mean of the longitudes
+    expected_lon = np.rad2deg(
+        np.arctan2(100 * np.sin(np.deg2rad(25)), 200 + 100 * np.cos(np.deg2rad(25)))
+    )
+    assert np.isclose(lon, expected_lon)
+    assert np.isclose(lat, 15.0)
+
+
+def test_compute_centroid_split_antimeridian_multipolygon():
+    # Halves of a footprint split along the antimeridian
+    multipolygon = MultiPolygon(
+        [
+            Polygon([(170, 10), (180, 10), (180, 20), (170, 20), (170, 10)]),
+            Polygon([(-180, 10), (-170, 10), (-170, 20), (-180, 20), (-180, 10)]),
+        ]
+    )
+    lon, lat = compute_centroid(multipolygon)
+
+    assert np.isclose(abs(lon), 180.0)
+    assert np.isclose(lat, 15.0)
+
+
+def test_compute_centroid_polar_cap_ring():
+    # Ring as built for a footprint containing the North Pole: the edge along
+    # the pole from 180 to -180 is not an antimeridian crossing
+    poly = Polygon(
+        [(-180, 70), (-60, 75), (0, 82), (120, 72), (180, 70), (180, 90), (-180, 90)]
+    )
+    lon, lat = compute_centroid(poly)
+
+    assert np.isclose(lon, poly.centroid.x)
+    assert np.isclose(lat, poly.centroid.y)
+    assert lat > 75
+
 
 def test_compute_centroid_invalid_type():
     with pytest.raises(UnsupportedGeometryTypeError):
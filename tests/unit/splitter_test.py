@@ -0,0 +1,169 @@
+import pytest
+from polar2wgs84.splitter import AntimeridianLineSplitter
+from polar2wgs84.splitter import AntimeridianSplitter
+from polar2wgs84.splitter import EquatorSplitter
+from shapely.geometry import LineString
+from shapely.geometry import MultiPolygon
+from shapely.geometry import Point
+from shapely.geometry import Polygon
+
+
+# -----------------------------------------------------------------------------
+# Fixtures
+# -----------------------------------------------------------------------------
+
+
+@pytest.fixture
+def northern_polygon():
+    """
+    Polygon entirely north of the equator.
+    """
+    return Polygon(
+        [
+            (-10, 10),
+            (10, 10),
+            (10, 20),
+            (-10, 20),
+            (-10, 10),
+        ]
+    )
+
+
+@pytest.fixture
+def southern_antimeridian_polygon():
+    """
+    Polygon south of the equator crossing the antimeridian.
+    """
+    return Polygon(
+        [
+            (170, -10),
+            (-170, -10),
+            (-170, -20),
+            (170, -20),
+            (170, -10),
+        ]
+    )
+
+
+# -----------------------------------------------------------------------------
+# EquatorSplitter
+# -----------------------------------------------------------------------------
+
+
+def test_equator_splitter_one_hemisphere_is_not_split(northern_polygon, mocker):
+    split_spy = mocker.patch("polar2wgs84.splitter.split")
+
+    result = EquatorSplitter(northern_polygon).make_valid_geojson_geometry()
+
+    split_spy.assert_not_called()
+    assert isinstance(result, Polygon)
+    assert result.equals(northern_polygon)
+
+
+def test_equator_splitter_one_hemisphere_crossing_antimeridian(
+    southern_antimeridian_polygon,
+):
+    result = EquatorSplitter(
+        southern_antimeridian_polygon
+    ).make_valid_geojson_geometry()
+
+    assert isinstance(result, MultiPolygon)
+    assert len(result.geoms) == 2
+    assert result.is_valid
+
+
+@pytest.mark.parametrize(
+    "coords, expected",
+    [
+        ([(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)], False),
+        ([(0, -10), (10, -10), (10, 0), (0, 0), (0, -10)], False),
+        ([(0, -10), (10, -10), (10, 10), (0, 10), (0, -10)], True),
+    ],
+)
+def test_crosses_equator(coords, expected):
+    assert EquatorSplitter._crosses_equator(Polygon(coords)) is expected
+
+
+def test_merge_polygons_disjoint_pieces_skip_union(
+    northern_polygon, southern_antimeridian_polygon, mocker
+):
+    union_spy = mocker.patch("polar2wgs84.splitter.shapely.union_all")
+
+    result = EquatorSplitter._merge_polygons(
+        [northern_polygon, southern_antimeridian_polygon]
+    )
+
+    union_spy.assert_not_called()
+    assert isinstance(result, MultiPolygon)
+    assert result.is_valid
+
+
+def test_merge_polygons_touching_pieces_are_unioned():
+    north = Polygon([(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)])
+    south = Polygon([(0, -10), (10, -10), (10, 0), (0, 0), (0, -10)])
+
+    result = EquatorSplitter._merge_polygons([north, south])
+
+    assert isinstance(result, Polygon)
+    assert result.area == pytest.approx(north.area + south.area)
+
+
+# -----------------------------------------------------------------------------
+# AntimeridianLineSplitter
+# -----------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "coords, expected",
+    [
+        # Single crossing: Point
+        ([(170, 10), (190, 20)], (180, 15)),
+        # Several crossings: second point of the MultiPoint
+        ([(170, 10), (190, 10), (170, 20), (190, 20)], (180, 15)),
+        # Segment along the antimeridian: its second vertex
+        ([(180, 10), (180, 20), (170, 20)], (180, 20)),
+    ],
+)
+def test_antimeridian_line_split_returns_point(coords, expected):
+    point = AntimeridianLineSplitter(LineString(coords)).split()
+
+    assert isinstance(point, Point)
+    assert point.coords[0] == pytest.approx(expected)
+
+
+# -----------------------------------------------------------------------------
+# AntimeridianSplitter
+# -----------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "coords, expected",
+    [
+        ([(170, 10), (180, 10), (180, 20), (170, 20), (170, 10)], False),
+        ([(180, 10), (190, 10), (190, 20), (180, 20), (180, 10)], True),
+    ],
+)
+def test_contains_lon_gt_180(coords, expected):
+    assert AntimeridianSplitter.contains_lon_gt_180(Polygon(coords)) is expected
+
+
+def test_normalize_part_to_180_shifts_only_the_east_part():
+    west = Polygon([(170, 10), (180, 10), (180, 20), (170, 20), (170, 10)])
+    east = Polygon([(180, 10), (190, 10), (190, 20), (180, 20), (180, 10)])
+
+    assert AntimeridianSplitter._normalize_part_to_180(west) is west
+    assert AntimeridianSplitter._normalize_part_to_180(east).bounds == (
+        -180,
+        10,
+        -170,
+        20,
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 4096])
+def test_crosses_antimeridian_chunked_scan(
+    southern_antimeridian_polygon, northern_polygon, chunk_size, mocker
+):
+    mocker.patch.object(AntimeridianSplitter, "CROSSING_CHUNK_SIZE", chunk_size)
+    assert AntimeridianSplitter.crosses_antimeridian(southern_antimeridian_polygon)
+    assert not AntimeridianSplitter.crosses_antimeridian(northern_polygon)